@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import threading
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+
+try:
+    from ansible_collections.community.xcat.plugins.modules.xcat_image \
+        import XcatImage
+    HAS_XCAT_IMAGE = True
+except ImportError:
+    HAS_XCAT_IMAGE = False
+
+# Serializes setup of the module-level session and listing caches in
+# xcat_image, which are shared by every task this controller process runs.
+# The API calls themselves run outside the lock so concurrent image builds
+# do not serialize behind one multi-minute generate.
+_LOCK = threading.Lock()
+
+# Mirrors the module argument spec; AnsibleModule is not involved when the
+# task runs on the controller so defaults and type coercion happen here.
+_ARGUMENT_SPEC = dict(
+    name=dict(type='str', required=True),
+    image_name=dict(required=False, default=None),
+    state=dict(type='str', required=True),
+    operation=dict(type='str', required=False, default='generate'),
+    objtype=dict(type='str', required=False, default='osimage'),
+    exlist=dict(type='str', required=False),
+    imagetype=dict(type='str', required=False, default='linux'),
+    osarch=dict(type='str', required=False, default='x86_64'),
+    osdistroname=dict(type='str', required=False),
+    osname=dict(type='str', required=False, default='Linux'),
+    osvers=dict(type='str', required=True),
+    otherpkgdir=dict(type='str', required=False),
+    permission=dict(type='str', required=False, default='755'),
+    pkgdir=dict(type='str', required=False),
+    pkglist=dict(type='str', required=False),
+    postinstall=dict(type='str', required=False),
+    profile=dict(type='str', required=False, default='compute'),
+    rootimgdir=dict(type='str', required=False),
+    template=dict(type='str', required=False),
+    update=dict(type='bool', required=False, default=False),
+    xcat_token=dict(type='str', required=True),
+    xcat_api=dict(type='str', required=True),
+    xcat_ca_bundle=dict(type='str', required=False, default=None),
+    validate_certs=dict(type='bool', required=False, default=True),
+    xcat_timeout=dict(type='int', required=False, default=30),
+)
+
+
+class _ControllerModule:
+    """Minimal stand-in for AnsibleModule when running on the controller."""
+
+    def fail_json(self, **kwargs):
+        raise AnsibleActionFail(kwargs.get('msg', 'xCat API call failed'))
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        # Controller-side execution is opt-in: by default the task runs as
+        # a regular module on the managed host, where xcat_api URIs like
+        # http://127.0.0.1/xcatws keep resolving as they always have.
+        args = dict(self._task.args)
+        run_on_controller = boolean(args.pop('run_on_controller', False))
+        if not run_on_controller or not HAS_XCAT_IMAGE:
+            result.update(self._execute_module(
+                module_name='community.xcat.xcat_image',
+                module_args=args, task_vars=task_vars))
+            return result
+        validation = ArgumentSpecValidator(_ARGUMENT_SPEC).validate(args)
+        if validation.error_messages:
+            raise AnsibleActionFail(
+                f"argument validation failed: "
+                f"{'; '.join(validation.error_messages)}")
+        image_args = dict(validation.validated_parameters)
+        result['changed'] = False
+        if image_args['state'] == 'stateless':
+            image_args['provmethod'] = 'netboot'
+        elif image_args['state'] == 'stateful':
+            image_args['provmethod'] = 'install'
+        else:
+            return result
+        if self._task.check_mode:
+            return result
+        with _LOCK:
+            image = XcatImage(image_args, _ControllerModule())
+        if image_args['update'] and image.exists():
+            result['changed'] = image.update()
+        elif image_args['operation'] == 'generate' and \
+                not image.exists(need_body=False):
+            if image.create():
+                image.generate()
+                result['changed'] = True
+            else:
+                raise AnsibleActionFail(
+                    f"Image {image_args['name']} not created.")
+        elif image_args['operation'] == 'package' and \
+                image.exists(need_body=False):
+            image.pack_up()
+            result['changed'] = True
+        result['image_name'] = image.get_image_name()
+        result['update'] = image_args['update']
+        return result
@@ -0,0 +1,34 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSIONS = {}
+
+def verify_setting(args):
+    if not args.get('validate_certs', True):
+        return False
+    return args.get('xcat_ca_bundle') or True
+
+def get_session(token=None, verify=True, pool_maxsize=8):
+    key = (token, verify, pool_maxsize)
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize,
+                              max_retries=Retry(total=3, backoff_factor=0.2,
+                                                status_forcelist=[502, 503,
+                                                                  504]))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        if token is not None:
+            session.headers.update({'X-Auth-Token': token})
+        session.verify = verify
+        _SESSIONS[key] = session
+    return session
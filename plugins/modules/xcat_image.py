@@ -155,6 +155,38 @@ options:
       - Token used to autenticate against the xCat API.
     type: str
     required: true
+  xcat_ca_bundle:
+    description:
+      - Path to a CA bundle file used to verify the xCat API TLS certificate.
+      - If not set the system CA bundle is used.
+    type: str
+    required: false
+  validate_certs:
+    description:
+      - Whether to verify the xCat API TLS certificate.
+      - Set to false for self-signed deployments without a CA bundle.
+    type: bool
+    required: false
+    default: true
+  xcat_timeout:
+    description:
+      - Timeout in seconds for individual requests to the xCat API.
+      - Long running generate and package operations are polled rather
+      than held open, so this does not bound the overall operation.
+    type: int
+    required: false
+    default: 30
+  run_on_controller:
+    description:
+      - Execute the xCat API calls from the controller instead of the
+      managed host, so the connection pool and caches persist across
+      all tasks of a play.
+      - The xcat_api URI must be reachable from the controller.
+      - Handled by the accompanying action plugin; the default keeps the
+      traditional target-side execution.
+    type: bool
+    required: false
+    default: false
 '''
 
 EXAMPLES = r'''
@@ -200,16 +232,60 @@ changed:
   returned: always
 '''
 
-import requests
+import hashlib
+import os
 import json
-import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.community.xcat.plugins.module_utils.xcat import (
+    get_session,
+    verify_setting,
+)
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+CACHE_DIR = os.path.expanduser('~/.ansible/tmp/xcat_cache')
+
+@lru_cache(maxsize=1)
+def _list_all_osimages(api, token, verify=True, timeout=30):
+    session = get_session(token, verify)
+    listing = session.get(f"{api}/osimages/ALLRESOURCES", timeout=timeout)
+    if listing.status_code != 200:
+        return {}
+    try:
+        parsed = _loads(listing.content)
+    except ValueError:
+        return {}
+    # Only a name->attributes mapping is usable here; some listing shapes
+    # are plain arrays of names, which cannot hydrate image_contents.
+    return parsed if isinstance(parsed, dict) else {}
 
 class XcatImage:
 
-    def __init__(self, image_args):
+    _COMMON_OPTIONS = frozenset({
+        'objtype', 'imagetype', 'osarch', 'osdistroname', 'osname',
+        'osvers', 'otherpkgdir', 'pkgdir', 'pkglist', 'profile',
+        'provmethod',
+    })
+    _STATEFUL_OPTIONS = frozenset({'template'})
+    _STATELESS_OPTIONS = frozenset({'permission', 'exlist', 'rootimgdir'})
+    # Options the per-image GET never echoes back; treating them as
+    # missing would turn every update into a diff and a regeneration.
+    _NON_ECHOED_OPTIONS = frozenset({'objtype'})
+
+    def __init__(self, image_args, module):
         self.image_args = image_args
+        self._module = module
         if image_args['image_name'] is not None:
             self.image_name = image_args['image_name']
         else:
@@ -217,116 +293,213 @@ class XcatImage:
                                f"{self.image_args['osarch']}-"
                                f"{self.image_args['provmethod']}-"
                                f"{self.image_args['name']}")
-        self.image_options = [
-            'imagetype', 'osarch', 'osdistroname', 'osname',
-            'osvers', 'otherpkgdir', 'pkgdir', 'pkglist', 'profile',
-            'provmethod', 'synclists', 'template', 'permission', 'postinstall',
-            'rootimgdir',
-        ]
-        self.__common_options = [
-            'objtype', 'imagetype', 'osarch', 'osdistroname', 'osname',
-            'osvers', 'otherpkgdir', 'pkgdir', 'pkglist', 'profile',
-            'provmethod',
-        ]
-        self.__stateful_options = [
-            'template'
-        ]
-        self.__stateless_options = [
-            'permission', 'exlist', 'rootimgdir'
-        ]
-        self.headers = {
-            'X-Auth-Token': self.image_args['xcat_token'],
-            'Content-Type': 'application/json'
-        }
+        self._url_image = (f"{self.image_args['xcat_api']}/osimages/"
+                           f"{self.image_name}")
+        self._url_instance = f"{self._url_image}/instance"
+        self._session = get_session(self.image_args['xcat_token'],
+                                    verify_setting(self.image_args))
+        self._exists = None
+        self._image_contents = None
+        self._image_body = None
 
     def get_image_name(self):
         return self.image_name
 
-    def exists(self):
-        verify_image = f"{self.image_args['xcat_api']}/osimages/{self.image_name}"
-        image_exists = requests.get(verify_image, verify=False,
-                                    headers=self.headers)
-        if image_exists.status_code == 200:
-            self.image_contents = image_exists.json()
-            return True
-        elif image_exists.status_code == 403:
-            return False
+    @property
+    def image_contents(self):
+        if self._image_contents is None and self._image_body is not None:
+            if isinstance(self._image_body, dict):
+                self._image_contents = self._image_body
+            else:
+                self._image_contents = _loads(self._image_body)
+        return self._image_contents
+
+    def _fail(self, response):
+        self._module.fail_json(
+            msg=(f"xCat API {response.request.method} {response.url} -> "
+                 f"{response.status_code}: {response.text[:200]}"),
+            status=response.status_code)
+
+    def _cache_path(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(CACHE_DIR, f"{key}.json")
+
+    def _read_cache(self, url):
+        try:
+            with open(self._cache_path(url)) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, url, response):
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': response.text,
+        }
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(url), 'w') as cache_file:
+                json.dump(entry, cache_file)
+        except OSError:
+            pass
+
+    def exists(self, need_body=True):
+        if self._exists is not None:
+            # A HEAD probe may have answered True without a body; refetch
+            # when the caller needs image_contents and none is held.
+            if not (need_body and self._exists and
+                    self._image_contents is None and
+                    self._image_body is None):
+                return self._exists
+        all_images = _list_all_osimages(
+            self.image_args['xcat_api'], self.image_args['xcat_token'],
+            self._session.verify,
+            self.image_args.get('xcat_timeout') or 30)
+        if self.image_name in all_images:
+            self._image_contents = {self.image_name:
+                                    all_images[self.image_name]}
+            self._exists = True
+            return self._exists
+        verify_image = self._url_image
+        timeout = self.image_args.get('xcat_timeout') or 30
+        if not need_body:
+            probe = self._session.head(verify_image, timeout=timeout)
+            if probe.status_code == 200:
+                self._exists = True
+            elif probe.status_code in (403, 404):
+                self._exists = False
+            else:
+                self._fail(probe)
+            return self._exists
+        cached = self._read_cache(verify_image)
+        conditional_headers = {}
+        if cached:
+            if cached.get('etag'):
+                conditional_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = \
+                    cached['last_modified']
+        image_exists = self._session.get(verify_image, timeout=timeout,
+                                         headers=conditional_headers)
+        if image_exists.status_code == 304 and cached:
+            self._image_body = cached['body']
+            self._exists = True
+        elif image_exists.status_code == 200:
+            self._image_body = image_exists.content
+            self._write_cache(verify_image, image_exists)
+            self._exists = True
+        elif image_exists.status_code in (403, 404):
+            self._exists = False
         else:
-            sys.exit(1)
+            self._fail(image_exists)
+        return self._exists
+
+    @staticmethod
+    def bulk_exists(session, api, names, max_workers=8):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(session.get,
+                                             f"{api}/osimages/{name}")
+                       for name in names}
+            return {name: future.result().status_code == 200
+                    for name, future in futures.items()}
 
     def update(self):
-        gen_image = False
-        update_endpoint = (f"{self.image_args['xcat_api']}/osimages/"
-                           f"{self.image_name}")
-        for key, value in self.image_contents[self.image_name].items():
-            if value != self.image_args[key]:
-                body_data = {key: self.image_args[key] }
-                process_update = requests.put(update_endpoint, verify=False,
-                                              headers=self.headers,
-                                              data=json.dumps(body_data))
-                if process_update.status_code != 200:
-                    sys.exit(1)
-                else:
-                    gen_image = True
-        for key, value in self.image_args.items():
-            if not key in self.image_contents[self.image_name] and \
-                    key in self.__common_options:
-                body_data = {key: self.image_args[key]}
-                process_update = requests.put(update_endpoint, verify=False,
-                                              headers=self.headers,
-                                              data=json.dumps(body_data))
-                if process_update.status_code != 200:
-                    sys.exit(1)
-                else:
-                    gen_image = True
-        if gen_image:
-            self.generate()
+        update_endpoint = self._url_image
+        image_contents = self.image_contents[self.image_name]
+        body_data = {key: self.image_args[key]
+                     for key, value in image_contents.items()
+                     if key in self.image_args and
+                     self.image_args[key] is not None and
+                     value != self.image_args[key]}
+        body_data.update({key: self.image_args[key]
+                          for key in
+                          self._COMMON_OPTIONS - self._NON_ECHOED_OPTIONS
+                          if key not in image_contents and
+                          self.image_args.get(key) is not None})
+        if not body_data:
+            return False
+        process_update = self._session.put(update_endpoint,
+                                           data=_dumps(body_data))
+        if process_update.status_code != 200:
+            self._fail(process_update)
+        _list_all_osimages.cache_clear()
+        self.generate()
+        return True
 
 
-    def generate(self):
-        generate_endpoint = (f"{self.image_args['xcat_api']}/osimages/"
-                             f"{self.image_name}/instance")
-        body_data = {"action":"gen",
+    def _run_instance_action(self, action):
+        body_data = {"action": action,
                      "params": [{"--tempfile": self.image_name}]}
-        process_generate = requests.post(generate_endpoint, verify=False,
-                                         headers=self.headers, timeout=900,
-                                         data=json.dumps(body_data))
-        if process_generate.status_code != 201:
-            sys.exit(1)
+        timeout = self.image_args.get('xcat_timeout') or 30
+        response = self._session.post(self._url_instance, timeout=timeout,
+                                      data=_dumps(body_data))
+        if response.status_code == 201:
+            return
+        if response.status_code != 202:
+            self._fail(response)
+        job_url = response.headers.get('Location')
+        if not job_url:
+            try:
+                body = _loads(response.content)
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                job_url = body.get('job')
+        if not job_url:
+            self._fail(response)
+        deadline = time.monotonic() + 900
+        delay = 1
+        while True:
+            status = self._session.get(job_url, timeout=timeout)
+            if status.status_code != 200:
+                self._fail(status)
+            try:
+                body = _loads(status.content)
+            except ValueError:
+                body = None
+            if not isinstance(body, dict):
+                self._fail(status)
+            state = str(body.get('state', '')).lower()
+            if state in ('complete', 'completed', 'done', 'success',
+                         'succeeded', 'finished'):
+                return
+            if state not in ('queued', 'pending', 'running'):
+                self._module.fail_json(
+                    msg=(f"xCat API job {job_url} ended in state "
+                         f"'{state}': {status.text[:200]}"))
+            if time.monotonic() >= deadline:
+                self._module.fail_json(
+                    msg=(f"xCat API job {job_url} still '{state}' after "
+                         f"900 seconds"))
+            time.sleep(delay)
+            delay = min(delay * 2, 15)
 
-    def create(self):
-        create_endpoint = (f"{self.image_args['xcat_api']}/osimages/"
-                           f"{self.image_name}")
-        body_data = {}
-        for key in self.__common_options:
-            if key in self.image_args.keys():
-                body_data[key] = self.image_args[key]
+    def generate(self):
+        self._run_instance_action('gen')
+
+    def _active_keys(self):
         if self.image_args['state'] == 'stateful':
-            for key in self.__stateful_options:
-                if key in self.image_args.keys():
-                    body_data[key] = self.image_args[key]
+            return self._COMMON_OPTIONS | self._STATEFUL_OPTIONS
         if self.image_args['state'] == 'stateless':
-            for key in self.__stateless_options:
-                if key in self.image_args.keys():
-                    body_data[key] = self.image_args[key]
-        process_create = requests.post(create_endpoint, verify=False,
-                                       headers=self.headers, timeout=900,
-                                       data=json.dumps(body_data))
+            return self._COMMON_OPTIONS | self._STATELESS_OPTIONS
+        return self._COMMON_OPTIONS
+
+    def create(self):
+        create_endpoint = self._url_image
+        body_data = {key: self.image_args[key]
+                     for key in self._active_keys()
+                     if self.image_args.get(key) is not None}
+        timeout = self.image_args.get('xcat_timeout') or 30
+        process_create = self._session.post(create_endpoint, timeout=timeout,
+                                            data=_dumps(body_data))
         if process_create.status_code != 201:
             return False
-        else:
-            return True
+        _list_all_osimages.cache_clear()
+        return True
 
     def pack_up(self):
-        packup_endpoint = (f"{self.image_args['xcat_api']}/osimages/"
-                           f"{self.image_name}/instance")
-        body_data = {"action":"pack",
-                     "params": [{"--tempfile": self.image_name}]}
-        process_packup = requests.post(packup_endpoint, verify=False,
-                                       headers=self.headers, timeout=900,
-                                       data=json.dumps(body_data))
-        if process_packup.status_code != 201:
-            sys.exit(1)
+        self._run_instance_action('pack')
 
 class xcat_stateless:
     def __init__(self, image_args):
@@ -358,6 +531,9 @@ def run_xcat_module():
         update=dict(type='bool',required=False,default=False),
         xcat_token=dict(type='str',required=True),
         xcat_api=dict(type='str', required=True),
+        xcat_ca_bundle=dict(type='str', required=False, default=None),
+        validate_certs=dict(type='bool', required=False, default=True),
+        xcat_timeout=dict(type='int', required=False, default=30),
     )
 
     # Seed the results dictionary just in case.
@@ -371,30 +547,7 @@ def run_xcat_module():
         supports_check_mode=True
     )
 
-    image_args = {
-        'name': xcat_module.params['name'],
-        'image_name': xcat_module.params['image_name'],
-        'state': xcat_module.params['state'],
-        'objtype': xcat_module.params['objtype'],
-        'exlist': xcat_module.params['exlist'],
-        'imagetype': xcat_module.params['imagetype'],
-        'osarch': xcat_module.params['osarch'],
-        'osdistroname': xcat_module.params['osdistroname'],
-        'osname': xcat_module.params['osname'],
-        'osvers': xcat_module.params['osvers'],
-        'otherpkgdir': xcat_module.params['otherpkgdir'],
-        'permission': xcat_module.params['permission'],
-        'pkgdir': xcat_module.params['pkgdir'],
-        'pkglist': xcat_module.params['pkglist'],
-        'postinstall': xcat_module.params['postinstall'],
-        'profile': xcat_module.params['profile'],
-        'rootimgdir': xcat_module.params['rootimgdir'],
-        'operation': xcat_module.params['operation'],
-        'template': xcat_module.params['template'],
-        'update': xcat_module.params['update'],
-        'xcat_token': xcat_module.params['xcat_token'],
-        'xcat_api': xcat_module.params['xcat_api'],
-    }
+    image_args = dict(xcat_module.params)
 
     if image_args['state'] == 'stateless':
         image_args['provmethod'] = 'netboot'
@@ -403,17 +556,22 @@ def run_xcat_module():
     else:
         xcat_module.exit_json(**result)
 
-    image = XcatImage(image_args)
+    image = XcatImage(image_args, xcat_module)
 
-    if image.exists() and image_args['update']:
-        image.update()
-    elif image_args['operation'] == 'generate' and not image.exists():
+    if image_args['update'] and image.exists():
+        result['changed'] = image.update()
+    elif image_args['operation'] == 'generate' and \
+            not image.exists(need_body=False):
         if image.create():
             image.generate()
+            result['changed'] = True
         else:
-            print(f"Image {image_args['name']} not created.")
-    elif image_args['operation'] == 'package' and image.exists():
+            xcat_module.fail_json(
+                msg=f"Image {image_args['name']} not created.")
+    elif image_args['operation'] == 'package' and \
+            image.exists(need_body=False):
         image.pack_up()
+        result['changed'] = True
 
     result['image_name'] = image.get_image_name()
     result['update'] = image_args['update']
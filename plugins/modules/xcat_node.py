@@ -16,6 +16,14 @@ options:
       - The name of the node.
     type: str
     required: true
+  names:
+    description:
+      - A list of node names to update in a single task.
+      - When set, the bootstate updates for all nodes are issued
+      concurrently and the name parameter is ignored.
+    type: list
+    elements: str
+    required: false
   image:
     description:
       - The name of the image to be used for the node.
@@ -39,6 +47,19 @@ options:
       - Token used to autenticate against the xCat API.
     type: str
     required: true
+  xcat_ca_bundle:
+    description:
+      - Path to a CA bundle file used to verify the xCat API TLS certificate.
+      - If not set the system CA bundle is used.
+    type: str
+    required: false
+  validate_certs:
+    description:
+      - Whether to verify the xCat API TLS certificate.
+      - Set to false for self-signed deployments without a CA bundle.
+    type: bool
+    required: false
+    default: true
 '''
 
 EXAMPLES = r'''
@@ -62,39 +83,70 @@ changed:
 
 import requests
 import json
-import sys
+
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.community.xcat.plugins.module_utils.xcat import (
+    get_session,
+    verify_setting,
+)
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    _dumps = json.dumps
+
+def bulk_set_bootstate(session, api, pairs, max_workers=16):
+    def _put(node_name, image_name):
+        try:
+            return session.put(f"{api}/nodes/{node_name}/bootstate",
+                               timeout=900,
+                               data=_dumps({'osimage': image_name}))
+        except requests.RequestException as exc:
+            return exc
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {node_name: executor.submit(_put, node_name, image_name)
+                   for node_name, image_name in pairs}
+        return {node_name: future.result()
+                for node_name, future in futures.items()}
 
 class XcatNode:
-    def __init__(self, image_args):
+    def __init__(self, image_args, module):
         self.__image_args = image_args
+        self.__module = module
         self.__node_name = image_args['name']
         self.__image_name = image_args['image']
-        self.__headers = {
-            'X-Auth-Token': image_args['xcat_token'],
-            'Content-Type': 'application/json'
-        }
+        self.__session = get_session(image_args['xcat_token'],
+                                     verify_setting(image_args))
 
     def set_bootstate(self):
         bootstate_uri = (f"{self.__image_args['xcat_api']}"
                          f"/nodes/{self.__node_name}/bootstate")
         body_data = {"osimage": f"{self.__image_name}"}
-        process_bootstate = requests.put(bootstate_uri, verify=False,
-                                         headers=self.__headers, timeout=900,
-                                         data=json.dumps(body_data))
+        process_bootstate = self.__session.put(bootstate_uri, timeout=900,
+                                               data=_dumps(body_data))
         if process_bootstate.status_code != 200:
-            sys.exit(1)
+            self.__module.fail_json(
+                msg=(f"xCat API PUT {process_bootstate.url} -> "
+                     f"{process_bootstate.status_code}: "
+                     f"{process_bootstate.text[:200]}"),
+                status=process_bootstate.status_code)
 
 
 def run_xcat_node_module():
 
     module_args = dict(
         name=dict(type='str', required=False),
+        names=dict(type='list', elements='str', required=False,
+                   default=None),
         image=dict(required=False, default=None),
         action=dict(type='str', required=True),
         xcat_token=dict(type='str', required=True),
         xcat_api=dict(type='str', required=True),
+        xcat_ca_bundle=dict(type='str', required=False, default=None),
+        validate_certs=dict(type='bool', required=False, default=True),
     )
 
     # Seed the results dictionary just in case.
@@ -108,18 +160,31 @@ def run_xcat_node_module():
         supports_check_mode=True
     )
 
-    image_args = {
-        'name': xcat_module.params['name'],
-        'image': xcat_module.params['image'],
-        'action': xcat_module.params['action'],
-        'xcat_token': xcat_module.params['xcat_token'],
-        'xcat_api': xcat_module.params['xcat_api'],
-    }
-
-    node = XcatNode(image_args)
+    image_args = dict(xcat_module.params)
 
     if image_args['action'] == 'bootstate':
-        node.set_bootstate()
+        if image_args['names']:
+            max_workers = 16
+            session = get_session(image_args['xcat_token'],
+                                  verify_setting(image_args),
+                                  pool_maxsize=max_workers)
+            responses = bulk_set_bootstate(
+                session, image_args['xcat_api'],
+                [(name, image_args['image'])
+                 for name in image_args['names']],
+                max_workers=max_workers)
+            failed = {}
+            for name, response in responses.items():
+                if isinstance(response, requests.RequestException):
+                    failed[name] = str(response)
+                elif response.status_code != 200:
+                    failed[name] = f"HTTP {response.status_code}"
+            if failed:
+                xcat_module.fail_json(
+                    msg=f"xCat API bootstate failed for: {failed}")
+        else:
+            node = XcatNode(image_args, xcat_module)
+            node.set_bootstate()
 
     if xcat_module.check_mode:
         xcat_module.exit_json(**result)
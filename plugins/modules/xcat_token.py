@@ -29,6 +29,19 @@ options:
       - The password for the API user.
     type: str
     required: true
+  xcat_ca_bundle:
+    description:
+      - Path to a CA bundle file used to verify the xCat API TLS certificate.
+      - If not set the system CA bundle is used.
+    type: str
+    required: false
+  validate_certs:
+    description:
+      - Whether to verify the xCat API TLS certificate.
+      - Set to false for self-signed deployments without a CA bundle.
+    type: bool
+    required: false
+    default: true
 '''
 
 EXAMPLES = r'''
@@ -60,10 +73,80 @@ token:
       returned: success
 '''
 
-import requests
+import hashlib
+import os
 import json
 
+from datetime import datetime, timedelta
+
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.community.xcat.plugins.module_utils.xcat import (
+    get_session,
+    verify_setting,
+)
+
+try:
+  import orjson
+  _dumps = orjson.dumps
+  _loads = orjson.loads
+except ImportError:
+  _dumps = json.dumps
+  _loads = json.loads
+
+TOKEN_CACHE_DIR = os.path.expanduser('~/.cache/xcat_token')
+
+def read_cached_token(cache_path):
+  """
+  Read a previously cached token from disk and validate that it has
+  not expired. Tokens from the xCat API are valid for roughly 24 hours
+  so a token cached by an earlier play can be reused without another
+  round-trip to the /tokens endpoint.
+
+  Parameters
+  ----------
+  cache_path : str
+    The full path of the JSON cache file for this API and user.
+
+  Returns
+  -------
+  token : json
+    The cached token JSON object if it is still valid for at least
+    60 seconds, otherwise None.
+  """
+  try:
+    with open(cache_path) as cache_file:
+      cached = json.load(cache_file)
+    expire = datetime.fromisoformat(cached['token']['expire'])
+    if expire - datetime.now() > timedelta(seconds=60):
+      return cached
+  except (OSError, KeyError, ValueError):
+    pass
+  return None
+
+def write_cached_token(cache_path, token):
+  """
+  Persist a freshly generated token to disk so that later module
+  invocations can reuse it. The file is created with mode 0600 since
+  the token is a credential.
+
+  Parameters
+  ----------
+  cache_path : str
+    The full path of the JSON cache file for this API and user.
+  token : json
+    The token JSON object returned by the xCat API.
+
+  Returns
+  -------
+  None
+  """
+  try:
+    os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+    fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as cache_file:
+      json.dump(token, cache_file)
+  except OSError:
+    pass
 
 def generate_token(token_args):
   """
@@ -85,13 +168,21 @@ def generate_token(token_args):
     The JSON object that is obtained from the XCAT API that includes
     the token ID string and the expiration date. 
   """
+  cache_key = hashlib.sha256(
+      f"{token_args['xcat_api']}|{token_args['xcat_api_user']}".encode()
+  ).hexdigest()
+  cache_path = os.path.join(TOKEN_CACHE_DIR, f"{cache_key}.json")
+  cached = read_cached_token(cache_path)
+  if cached is not None:
+    return cached
   get_token = f"{token_args['xcat_api']}/tokens"
   user_data = {'userName': token_args['xcat_api_user'],
                'userPW': token_args['xcat_api_password']}
-  token = requests.post(get_token, verify=False,
-                        headers={'Content-Type': 'application/json'},
-                        data=json.dumps(user_data))
-  return token.json()
+  session = get_session(verify=verify_setting(token_args))
+  token = session.post(get_token, data=_dumps(user_data))
+  token_data = _loads(token.content)
+  write_cached_token(cache_path, token_data)
+  return token_data
 
 
 def run_xcat_module():
@@ -115,6 +206,8 @@ def run_xcat_module():
       xcat_api=dict(type='str', required=True),
       xcat_api_user=dict(type='str', required=True),
       xcat_api_password=dict(type='str', required=True),
+      xcat_ca_bundle=dict(type='str', required=False, default=None),
+      validate_certs=dict(type='bool', required=False, default=True),
   )
 
   # Seed the results dictionary just in case.
@@ -127,11 +220,7 @@ def run_xcat_module():
       supports_check_mode=True
   )
 
-  token_args = {
-      'xcat_api': xcat_module.params['xcat_api'],
-      'xcat_api_user': xcat_module.params['xcat_api_user'],
-      'xcat_api_password': xcat_module.params['xcat_api_password'],
-  }
+  token_args = dict(xcat_module.params)
 
   token = generate_token(token_args)
 